@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from types import NoneType
-from typing import Any, Generic
+from typing import TYPE_CHECKING, Any, Generic
 
 from factory.base import BaseFactory as _BaseFactory
 
@@ -21,9 +21,12 @@ class FactoryMetaClass(_FactoryMetaClass):  # type: ignore[misc]
     """Factory metaclass that uses `BaseT` for `Meta.model` and updates `Meta.exclude` for sub factory classes."""
 
     # This is here only for type hinting reasons when you create an instance of
-    # a factory directly e.g. ShopFactory() -> Any
-    def __call__(cls, **kwargs: Any) -> Any:  # noqa U100
-        return super().__call__(**kwargs)
+    # a factory directly e.g. ShopFactory() -> Any.
+    # It is hidden at runtime so calling a factory doesn't go through an extra Python frame
+    if TYPE_CHECKING:
+
+        def __call__(cls, **kwargs: Any) -> Any:  # noqa U100
+            return super().__call__(**kwargs)
 
     def __new__(
         mcs,
@@ -78,21 +81,11 @@ class FactoryMetaClass(_FactoryMetaClass):  # type: ignore[misc]
 class BaseFactory(_BaseFactory, Generic[BaseT]):  # type: ignore[misc]
     @classmethod
     def build(cls, **kwargs: Any) -> BaseT:
-        try:
-            base: BaseT = super().build(**kwargs)
-        except Exception as e:
-            raise ModelCreationError(str(e)) from None
-
-        return cls._process(base=base)
+        return cls._process(base=cls._build_base(**kwargs))
 
     @classmethod
     def create(cls, **kwargs: Any) -> BaseT:
-        try:
-            base: BaseT = super().create(**kwargs)
-        except Exception as e:
-            raise ModelCreationError(str(e)) from None
-
-        return cls._process(base=base)
+        return cls._process(base=cls._create_base(**kwargs))
 
     @classmethod
     def build_batch(cls, size: int, **kwargs: Any) -> list[BaseT]:
@@ -102,6 +95,30 @@ class BaseFactory(_BaseFactory, Generic[BaseT]):  # type: ignore[misc]
     def create_batch(cls, size: int, **kwargs: Any) -> list[BaseT]:
         return super().create_batch(size, **kwargs)  # type: ignore[no-any-return]
 
+    @classmethod
+    def _build_base(cls, **kwargs: Any) -> Any:
+        """Build the base model object without processing it.
+
+        Raises:
+            ModelCreationError: if the base model object fails to be built
+        """
+        try:
+            return super().build(**kwargs)
+        except Exception as e:
+            raise ModelCreationError(str(e)) from None
+
+    @classmethod
+    def _create_base(cls, **kwargs: Any) -> Any:
+        """Create the base model object without processing it.
+
+        Raises:
+            ModelCreationError: if the base model object fails to be created
+        """
+        try:
+            return super().create(**kwargs)
+        except Exception as e:
+            raise ModelCreationError(str(e)) from None
+
     @classmethod
     def _process(cls, base: BaseT) -> BaseT:
         return base
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import datetime
 import json
-from copy import deepcopy
+import weakref
 from dataclasses import dataclass
 from enum import Enum
 from types import NoneType
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Generic,
 )
 from uuid import UUID
@@ -26,7 +28,7 @@ from multi_factory.meta import (
     has_domain_cls,
     has_schema_cls,
     inject_meta_and_excludes,
-    resolve_attribute,
+    resolve_attributes,
     validate_factory,
 )
 from multi_factory.types import DomainT, EnumConversionMap, SchemaT
@@ -36,13 +38,33 @@ from multi_factory.errors import FactoryError
 from multi_factory.types import Schema
 
 
+# Schema instances shared between all factories that use the same schema class.
+# The instances are only weakly referenced, so an entry is dropped once no factory class uses its schema anymore
+_SCHEMA_CACHE: weakref.WeakValueDictionary[type[Schema], Schema] = (
+    weakref.WeakValueDictionary()
+)
+
+# Types that are already JSON serialisable and can be returned as is
+_JSON_NATIVE_TYPES = frozenset((str, int, float, bool, NoneType))
+
+# Exact type to JSON serialiser map, checked before falling back to slower `isinstance` checks
+_JSON_SERIALISERS: dict[type[Any], Callable[[Any], Any]] = {
+    datetime.date: datetime.date.isoformat,
+    datetime.datetime: datetime.datetime.isoformat,
+    UUID: str,
+}
+
+
 class JSONToDomainFactoryMetaClass(_FactoryMetaClass):  # type: ignore[misc]
     """JSONToDomainFactory metaclass that uses `dict` for `Meta.model` and updates `Meta.exclude` for sub factory classes."""
 
     # This is here only for type hinting reasons when you create an instance of
-    # a factory directly e.g. ShopFactory() -> FactoryResult[Any]
-    def __call__(cls, **kwargs: Any) -> JSONToDomainFactoryResult[Any]:  # noqa U100
-        return super().__call__(**kwargs)  # type: ignore
+    # a factory directly e.g. ShopFactory() -> FactoryResult[Any].
+    # It is hidden at runtime so calling a factory doesn't go through an extra Python frame
+    if TYPE_CHECKING:
+
+        def __call__(cls, **kwargs: Any) -> JSONToDomainFactoryResult[Any]:  # noqa U100
+            return super().__call__(**kwargs)  # type: ignore
 
     def __new__(
         mcs,
@@ -79,26 +101,18 @@ class JSONToDomainFactoryMetaClass(_FactoryMetaClass):  # type: ignore[misc]
 
         # Get the meta, schema and enum_conversion_map attributes from the parent factory
         # (if this new factory is a subclass of another factory class)
-        base_meta = resolve_attribute(name="_meta", bases=bases)
-        base_schema: Schema | None = resolve_attribute(name="_schema", bases=bases)
-        base_enum_conversion_map: EnumConversionMap = resolve_attribute(
-            name="_enum_conversion_map", bases=bases, default={}
+        base_meta, base_schema, base_enum_conversion_map = resolve_attributes(
+            names=("_meta", "_schema", "_enum_conversion_map"),
+            bases=bases,
+            defaults={"_enum_conversion_map": {}},
         )
 
         # If the parent factory is abstract we must obtain `domain_cls` and `schema_cls` from the new factory class
         domain_cls: type[Any] | type[None] = NoneType
         if base_meta and base_meta.abstract:
-            _, domain_cls, schema_cls = get_generic_args(attrs=attrs)
-            domain_cls = get_origin_cls(domain_cls)
-
-            # Make sure that `domain_cls` and `schema_cls` are provided
-            if not has_domain_cls(domain_cls) or not has_schema_cls(schema_cls):
-                raise FactoryError(
-                    f"Failed to define '{class_name}' : Must provide generic domain and schema types"
-                )
-
-            # The `schema_cls` is valid, so create an instance of it
-            schema = schema_cls()
+            domain_cls, schema = mcs._get_domain_cls_and_schema(
+                class_name=class_name, attrs=attrs
+            )
 
         inject_meta_and_excludes(
             attrs=attrs,
@@ -116,6 +130,9 @@ class JSONToDomainFactoryMetaClass(_FactoryMetaClass):  # type: ignore[misc]
 
         # Verify that the factory can create the defined model, json and domain forms
         result = validate_factory(new_factory_cls)
+        if result is None:
+            # Validation is disabled, so there is no result to check the domain type of
+            return new_factory_cls  # type: ignore[no-any-return]
 
         # Make sure that the `domain_cls` that `schema_cls` uses is the same as the provided `domain_cls` for this factory
         assert isinstance(result, JSONToDomainFactoryResult)
@@ -126,8 +143,39 @@ class JSONToDomainFactoryMetaClass(_FactoryMetaClass):  # type: ignore[misc]
 
         return new_factory_cls  # type: ignore[no-any-return]
 
+    @classmethod
+    def _get_domain_cls_and_schema(
+        mcs, class_name: str, attrs: dict[str, Any]
+    ) -> tuple[type[Any], Schema]:
+        """Get the domain class and schema instance for a new factory class from its generic type args.
+
+        Raises:
+            FactoryError: if the generic domain and schema types aren't provided
+        """
+        _, domain_cls, schema_cls = get_generic_args(attrs=attrs)
+        domain_cls = get_origin_cls(domain_cls)
 
-@dataclass
+        # Make sure that `domain_cls` and `schema_cls` are provided
+        if not has_domain_cls(domain_cls) or not has_schema_cls(schema_cls):
+            raise FactoryError(
+                f"Failed to define '{class_name}' : Must provide generic domain and schema types"
+            )
+
+        # The `schema_cls` is valid, so create an instance of it (or reuse the instance
+        # already created for another factory that uses the same `schema_cls`)
+        schema = _SCHEMA_CACHE.get(schema_cls)
+        if schema is None:
+            schema = schema_cls()
+            try:
+                _SCHEMA_CACHE[schema_cls] = schema
+            except TypeError:
+                # Schema instances that can't be weakly referenced (e.g. due to `__slots__`) just aren't shared
+                pass
+
+        return domain_cls, schema
+
+
+@dataclass(slots=True)
 class JSONToDomainFactoryResult(Generic[DomainT]):
     """Factory result object that contains 3 attributes.
 
@@ -150,6 +198,11 @@ class JSONToDomainFactory(
 ):
     """Factory class for generating a dict base model that gets converted into JSON serialisable dict and domain object forms.
 
+    The JSON serialisable dict is passed directly into the schema's `load` method, so the schema must not mutate it.
+
+    Factories that use the same schema class share a single schema instance, so any mutable state on that
+    instance (e.g. a marshmallow schema's `context`) is shared between those factories too.
+
     Args:
         exclude (str | tuple[str, ...]): attributes to exclude when creating instances of the model, defaults to `()`
         enum_conversion_map (EnumConversionMap | None): enum type to callable map that handles how to convert enum
@@ -159,30 +212,165 @@ class JSONToDomainFactory(
     _schema: SchemaT
     _enum_conversion_map: EnumConversionMap
 
+    # Errors raised by `_schema.load` when the JSON data fails validation
+    _schema_validation_errors: tuple[type[Exception], ...] = (ValidationError,)
+
+    @classmethod
+    def build_batch(
+        cls, size: int, **kwargs: Any
+    ) -> list[JSONToDomainFactoryResult[DomainT]]:
+        build_base = cls._build_base
+        return cls._process_batch(bases=[build_base(**kwargs) for _ in range(size)])
+
+    @classmethod
+    def create_batch(
+        cls, size: int, **kwargs: Any
+    ) -> list[JSONToDomainFactoryResult[DomainT]]:
+        create_base = cls._create_base
+        return cls._process_batch(bases=[create_base(**kwargs) for _ in range(size)])
+
+    @classmethod
+    def _process_batch(
+        cls, bases: list[Any]
+    ) -> list[JSONToDomainFactoryResult[DomainT]]:
+        """Process all of `bases` at once, using a single `many=True` schema load for the domain objects.
+
+        Schema validation errors for a batch are reported per index of `bases`, e.g. `{0: {...}, 1: {...}}`.
+        """
+        raw_jsons, domains = cls._load_domain(bases, many=True)
+
+        return [
+            JSONToDomainFactoryResult(base=base, json=raw_json, domain=domain)
+            for base, raw_json, domain in zip(bases, raw_jsons, domains)
+        ]
+
     @classmethod
     def _process(cls, base: Any) -> JSONToDomainFactoryResult[DomainT]:
+        raw_json, domain = cls._load_domain(base)
+
+        return JSONToDomainFactoryResult(base=base, json=raw_json, domain=domain)
+
+    @classmethod
+    def _load_domain(cls, base: Any, many: bool = False) -> tuple[Any, Any]:
+        """Convert `base` into a JSON serialisable form and load the domain object from it using `_schema`.
+
+        If `many` is `True`, `base` is a list of base models that are all loaded in a single `_schema.load(..., many=True)`
+        call. Otherwise `_schema.load` is called with only the JSON data, so schemas that don't support `many` still work
+        for `build` and `create`.
+
+        Raises:
+            JSONSerialisationError: if `base` fails to be converted into a JSON serialisable form
+            SchemaValidationError: if `_schema` fails to validate the JSON serialisable form
+            DomainCreationError: if the domain object fails to be created
+        """
         try:
-            raw_json = json.loads(json.dumps(base, default=cls._json_serialise))
+            raw_json = cls._to_json_value(base)
         except Exception as e:
             raise JSONSerialisationError(str(e)) from None
 
         try:
-            # We create a deepcopy of `raw_json` in case if the schema mutates the `raw_json` dict
-            domain = cls._schema.load(deepcopy(raw_json))
-        except ValidationError as e:
+            # `raw_json` is passed to the schema as is (without copying it first), so the schema
+            # must not mutate its input data or the mutation will show up in the result's `json`
+            if many:
+                domain = cls._schema.load(raw_json, many=True)
+            else:
+                domain = cls._schema.load(raw_json)
+        except cls._schema_validation_errors as e:
             raise SchemaValidationError(str(e)) from None
         except Exception as e:
             raise DomainCreationError(str(e)) from None
 
-        return JSONToDomainFactoryResult(base=base, json=raw_json, domain=domain)
+        return raw_json, domain
+
+    @classmethod
+    def _to_json_value(
+        cls, value: Any, enum_conversion_map: EnumConversionMap | None = None
+    ) -> Any:
+        """Recursively convert the provided `value` into a JSON serialisable form in a single pass.
+
+        Produces the same result as `json.loads(json.dumps(value, default=cls._json_serialise))`
+        without encoding to and decoding from an intermediate string (except that a circular reference
+        is raised as a `TypeError` rather than a `ValueError`).
+
+        `enum_conversion_map` defaults to the factory's `_enum_conversion_map`; it is looked up once
+        and used for every nested value rather than being looked up on the class per value.
+
+        Raises:
+            TypeError: if we fail to convert `value` or any of its nested values
+        """
+        if enum_conversion_map is None:
+            enum_conversion_map = cls._enum_conversion_map
+
+        # Bind the helpers once so the recursive walk below only uses local lookups
+        json_serialise = cls._json_serialise
+        to_json_key = cls._to_json_key
+
+        def convert(value: Any, serialising: tuple[Any, ...] = ()) -> Any:
+            value_type = type(value)
+            if value_type in _JSON_NATIVE_TYPES:
+                return value
+            if value_type is dict or isinstance(value, dict):
+                return {
+                    key if type(key) is str else to_json_key(key): convert(item)
+                    for key, item in value.items()
+                }
+            if value_type is list or isinstance(value, (list, tuple)):
+                return [convert(item) for item in value]
+
+            # Subclasses of native types (e.g. `IntEnum`) are encoded using their underlying value
+            if isinstance(value, str):
+                return str.__str__(value)
+            if isinstance(value, int):
+                return int.__int__(value)
+            if isinstance(value, float):
+                return float.__float__(value)
+
+            # `serialising` holds the values that were serialised into `value`, so if `value` is one of
+            # them serialising it again would just end up back here, recursing forever
+            if any(value is item for item in serialising):
+                raise TypeError(
+                    f"Circular reference detected when JSON encoding value : {value}"
+                )
+
+            # Like `json.dumps(default=...)`, the serialised value is converted again as it may not
+            # be JSON serialisable itself (e.g. an enum converter that returns a `UUID` or a `tuple`)
+            return convert(
+                json_serialise(value, enum_conversion_map), (*serialising, value)
+            )
+
+        return convert(value)
+
+    @staticmethod
+    def _to_json_key(key: Any) -> str:
+        """Convert the provided dict `key` into a JSON object key.
+
+        Raises:
+            TypeError: if `key` is not a str, int, float, bool or None
+        """
+        if isinstance(key, str):
+            return str.__str__(key)
+        if key is None or isinstance(key, (int, float)):
+            return json.dumps(key)
+
+        raise TypeError(
+            f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+        )
 
     @classmethod
-    def _json_serialise(cls, value: Any) -> Any:
+    def _json_serialise(
+        cls, value: Any, enum_conversion_map: EnumConversionMap | None = None
+    ) -> Any:
         """Convert the provided `value` into a JSON serialisable form.
 
+        `enum_conversion_map` defaults to the factory's `_enum_conversion_map`.
+
         Raises:
             TypeError: if we fail to convert `value`
         """
+        serialiser = _JSON_SERIALISERS.get(type(value))
+        if serialiser is not None:
+            return serialiser(value)
+
         if isinstance(value, JSONToDomainFactoryResult):
             raise TypeError(
                 "Must use 'base' property when instantiating a list of sub factories inside a factory declaration e.g sub_factories = [SubFactory().base]"
@@ -193,14 +381,25 @@ class JSONToDomainFactory(
             return str(value)
         if isinstance(value, Enum):
             enum_type = type(value)
+            if enum_conversion_map is None:
+                enum_conversion_map = cls._enum_conversion_map
 
             # if `value` is in the enum conversion map,
             # use it's mapped callable to convert it into some JSON serialisable form
-            if enum_type in cls._enum_conversion_map:
-                return cls._enum_conversion_map[enum_type](value)
+            # (skipping the lookup entirely when no map was provided, which is the common case)
+            if enum_conversion_map and enum_type in enum_conversion_map:
+                return enum_conversion_map[enum_type](value)
 
-            # Just use the name for `value` by default if no conversion mapping
+            # Use the factory's default enum conversion for `value` if no conversion mapping
             # was provided for `value`
-            return value.name
+            return cls._default_enum_json_value(value)
 
         raise TypeError(f"Failed to JSON encode value : {value}")
+
+    @staticmethod
+    def _default_enum_json_value(value: Enum) -> Any:
+        """Convert the provided enum `value` into a JSON serialisable form when it isn't in the enum conversion map.
+
+        Just uses the name of `value` by default.
+        """
+        return value.name
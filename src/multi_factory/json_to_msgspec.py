@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Generic
+
+import msgspec
+
+from multi_factory.errors import FactoryError
+from multi_factory.json_to_domain import (
+    JSONToDomainFactory,
+    JSONToDomainFactoryMetaClass,
+)
+from multi_factory.meta import get_generic_args, get_origin_cls, has_domain_cls
+from multi_factory.types import DomainT, Schema
+
+
+class MsgspecSchema(Generic[DomainT]):
+    """Schema that validates and converts JSON data into `domain_cls` objects using `msgspec.convert`."""
+
+    def __init__(self, domain_cls: type[DomainT]) -> None:
+        self._domain_cls = domain_cls
+        self._many_domain_cls = list[domain_cls]  # type: ignore[valid-type]
+
+    def load(self, data: Any, many: bool = False) -> Any:
+        if many:
+            return msgspec.convert(data, self._many_domain_cls)
+        return msgspec.convert(data, self._domain_cls)
+
+
+class JSONToMsgspecFactoryMetaClass(JSONToDomainFactoryMetaClass):
+    """JSONToMsgspecFactory metaclass that creates a `MsgspecSchema` for the generic domain type."""
+
+    @classmethod
+    def _get_domain_cls_and_schema(
+        mcs, class_name: str, attrs: dict[str, Any]
+    ) -> tuple[type[Any], Schema]:
+        """Get the domain class and schema instance for a new factory class from its generic type arg.
+
+        Raises:
+            FactoryError: if the generic domain type isn't provided
+        """
+        # A single generic type arg is returned in the first position
+        domain_cls, *_ = get_generic_args(attrs=attrs)
+        domain_cls = get_origin_cls(domain_cls)
+
+        # Make sure that `domain_cls` is provided
+        if not has_domain_cls(domain_cls):
+            raise FactoryError(
+                f"Failed to define '{class_name}' : Must provide generic domain type"
+            )
+
+        return domain_cls, MsgspecSchema(domain_cls)
+
+
+class JSONToMsgspecFactory(
+    JSONToDomainFactory[DomainT, MsgspecSchema[DomainT]],
+    metaclass=JSONToMsgspecFactoryMetaClass,
+    abstract=True,
+):
+    """Factory class for generating a dict base model that gets converted into JSON serialisable dict and domain object forms.
+
+    The domain object is created by passing the JSON serialisable dict into `msgspec.convert`, so the generic
+    domain type can be any type that `msgspec` supports (e.g. a `msgspec.Struct` or a `@dataclass`).
+
+    As `msgspec` decodes enums from their values, enums are converted into their values by default
+    (rather than their names) unless they are in `enum_conversion_map`.
+
+    Args:
+        exclude (str | tuple[str, ...]): attributes to exclude when creating instances of the model, defaults to `()`
+        enum_conversion_map (EnumConversionMap | None): enum type to callable map that handles how to convert enum
+                                                        values into a JSON serialisable form, defaults to `None`
+    """
+
+    _schema_validation_errors = (msgspec.ValidationError,)
+
+    @staticmethod
+    def _default_enum_json_value(value: Enum) -> Any:
+        """Convert the provided enum `value` into a JSON serialisable form when it isn't in the enum conversion map.
+
+        Uses the value of `value`, as that's what `msgspec` decodes enums from.
+        """
+        return value.value
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-
+import os
 from types import NoneType
 from typing import (
     Any,
@@ -20,10 +20,29 @@ from multi_factory.errors import (
 )
 from multi_factory.types import EnumConversionMap, Schema
 
+# Values of the `MULTI_FACTORY_VALIDATE` environment variable that turn off factory validation
+_DISABLED_VALUES = frozenset(("0", "false", "no", "off"))
+
+
+def _validation_enabled(value: str | None) -> bool:
+    """Check if the provided `MULTI_FACTORY_VALIDATE` environment variable `value` keeps factory validation enabled.
+
+    Validation is only disabled by `0`, `false`, `no` or `off` (ignoring case and surrounding whitespace),
+    so any other value (or no value at all) keeps it enabled.
+    """
+    return value is None or value.strip().lower() not in _DISABLED_VALUES
+
+
+# Set `MULTI_FACTORY_VALIDATE=0` to skip building every factory class when it is defined
+VALIDATE_FACTORIES = _validation_enabled(os.environ.get("MULTI_FACTORY_VALIDATE"))
+
+# Sentinel used to tell a missing attribute apart from an attribute set to `None`
+_MISSING = object()
+
 
 class BaseMeta:
     model: type[Any]
-    exclude: tuple[str, ...] = ()
+    exclude: frozenset[str] | tuple[str, ...] = ()
     abstract: bool = False
 
 
@@ -61,13 +80,17 @@ def inject_meta_and_excludes(
     if not meta:
         meta = BaseMeta()
 
-    # Merge `meta.exclude` with the provided `exclude` and `base_meta.exclude`
+    # Merge `meta.exclude` with the provided `exclude` and `base_meta.exclude` in a single pass.
+    # This is stored as a `frozenset` as `factory_boy` checks every generated attribute against it on each build
     if isinstance(exclude, str):
         exclude = (exclude,)
-    if hasattr(meta, "exclude"):
-        exclude += meta.exclude
-    if base_meta and hasattr(base_meta, "exclude"):
-        exclude += base_meta.exclude
+    excludes = frozenset(
+        (
+            *exclude,
+            *getattr(meta, "exclude", ()),
+            *(getattr(base_meta, "exclude", ()) if base_meta else ()),
+        )
+    )
 
     # Bind an instance of `schema` or `base_schema` to the new factory class if provided for later use
     if schema:
@@ -76,24 +99,30 @@ def inject_meta_and_excludes(
         attrs["_schema"] = base_schema
 
     # Bind the enum conversion map to the factory to use for converting enums into a JSON
-    # serialisable form if it is provided
+    # serialisable form if it is provided. It is flattened into a single new dict with `base_enum_conversion_map`
+    # here (with the new factory's mappings taking precedence), so serialisation only needs a single lookup
     if base_enum_conversion_map is not None and enum_conversion_map is not None:
-        enum_conversion_map |= base_enum_conversion_map
+        enum_conversion_map = base_enum_conversion_map | enum_conversion_map
     if enum_conversion_map is not None:
         attrs["_enum_conversion_map"] = enum_conversion_map
 
     # Bind `model_cls` and `exclude` to the inner meta class before the factory class is created
     meta.model = model_cls
-    meta.exclude = exclude
+    meta.exclude = excludes
     attrs["Meta"] = meta
 
 
 def validate_factory(new_factory_cls: type[Any]) -> Any:
     """Validate that `new_factory_cls` can be instantiated without any errors.
 
+    Returns the built instance, or `None` without building anything if `VALIDATE_FACTORIES` is disabled.
+
     Raises:
         FactoryError: if `new_factory_cls` fails to be instantiated
     """
+    if not VALIDATE_FACTORIES:
+        return None
+
     try:
         return new_factory_cls.build()
     except Exception as e:
@@ -141,6 +170,31 @@ def has_schema_cls(
 def resolve_attribute(name: str, bases: tuple[type[Any]], default: Any = None) -> Any:
     """Find the first definition of an attribute according to MRO order."""
     for base in bases:
-        if hasattr(base, name):
-            return getattr(base, name)
+        value = getattr(base, name, _MISSING)
+        if value is not _MISSING:
+            return value
     return default
+
+
+def resolve_attributes(
+    names: tuple[str, ...],
+    bases: tuple[type[Any]],
+    defaults: dict[str, Any] | None = None,
+) -> tuple[Any, ...]:
+    """Find the first definition of each attribute in `names` according to MRO order.
+
+    This walks `bases` once for all of `names` and stops as soon as every attribute is found.
+    Attributes that aren't found are set to their value in `defaults` (or `None`).
+    """
+    defaults = defaults or {}
+    resolved: dict[str, Any] = {}
+    for base in bases:
+        for name in names:
+            if name in resolved:
+                continue
+            value = getattr(base, name, _MISSING)
+            if value is not _MISSING:
+                resolved[name] = value
+        if len(resolved) == len(names):
+            break
+    return tuple(resolved.get(name, defaults.get(name)) for name in names)
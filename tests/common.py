@@ -4,20 +4,20 @@ import pytest
 from multi_factory import BaseFactory
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChildDomain:
     first_name: str
     second_name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParentDomain:
     first_name: str
     second_name: str
     children: list[ChildDomain]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParentWithSingleChildDomain:
     first_name: str
     second_name: str
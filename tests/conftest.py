@@ -4,34 +4,38 @@ import pytest
 from tests import common
 
 
-@pytest.fixture
+# The below fixtures are session scoped so they are only built once per test run,
+# which means the returned values are shared between tests and must not be mutated
+
+
+@pytest.fixture(scope="session")
 def child_dict() -> dict[str, Any]:
     return {"first_name": "Billy", "second_name": "Jim"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parent_dict(child_dict: dict[str, Any]) -> dict[str, Any]:
     return {"first_name": "Jim", "second_name": "Jim", "children": [child_dict]}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parent_with_single_child_dict(child_dict: dict[str, Any]) -> dict[str, Any]:
     return {"first_name": "Jim", "second_name": "Jim", "child": child_dict}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def child_domain() -> common.ChildDomain:
     return common.ChildDomain(first_name="Billy", second_name="Jim")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parent_domain(child_domain: common.ChildDomain) -> common.ParentDomain:
     return common.ParentDomain(
         first_name="Jim", second_name="Jim", children=[child_domain]
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parent_with_single_child_domain(
     child_domain: common.ChildDomain,
 ) -> common.ParentWithSingleChildDomain:
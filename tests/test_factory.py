@@ -3,6 +3,7 @@ from typing import Callable
 import pytest
 from multi_factory import errors
 from multi_factory.base import Factory
+from multi_factory.meta import _validation_enabled
 from multi_factory.utils import lazy_attribute
 from tests import common
 from tests.common import ChildDomain, ParentDomain, inject_factory_method
@@ -19,90 +20,130 @@ class ParentFactory(Factory[ParentDomain]):
     children = lazy_attribute(lambda: [ChildFactory.build()])
 
 
-@inject_factory_method(ParentFactory)
-def test_factory(
-    factory_method: Callable[..., common.ParentDomain],
-    parent_domain: common.ParentDomain,
-) -> None:
-    model = factory_method()
-    assert model == parent_domain
+# `other_field` shouldn't get used when creating the model for this factory
+class ExcludesFactory(Factory[ChildDomain], exclude="other_field"):
+    first_name = "Billy"
+    second_name = "Jim"
+    other_field = "Bob"
 
 
-@inject_factory_method(ParentFactory, batch=True)
-def test_factory_batch(
-    factory_method: Callable[..., list[common.ParentDomain]],
-    parent_domain: common.ParentDomain,
-) -> None:
-    models = factory_method(size=1)
-    assert models == [parent_domain]
+# `another_field` shouldn't get used when creating the model for this factory
+class ExcludesBaseFactory(Factory[ChildDomain], exclude="another_field"):
+    first_name = "Billy"
+    second_name = "Jim"
+    another_field = "Bob"
 
 
-def test_factory_excludes(child_domain: common.ChildDomain) -> None:
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(Factory[common.ChildDomain], exclude="other_field"):
-        first_name = "Billy"
-        second_name = "Jim"
-        other_field = "Bob"
+# `other_field` shouldn't get used when creating the model for this factory
+class ExcludesDerivedFactory(ExcludesBaseFactory, exclude="other_field"):
+    other_field = "Bob"
 
-    assert _ExcludesFactory() == child_domain
 
+# `other_field` shouldn't get used when creating the model for this factory
+class ExcludesInMetaFactory(Factory[ChildDomain]):
+    class Meta:
+        exclude = ("other_field",)
 
-def test_factory_excludes_merges_with_superclass(
-    child_domain: common.ChildDomain,
-) -> None:
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(Factory[common.ChildDomain], exclude="another_field"):
-        first_name = "Billy"
-        second_name = "Jim"
-        another_field = "Bob"
+    first_name = "Billy"
+    second_name = "Jim"
+    other_field = "Bob"
 
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesDerivedFactory(_ExcludesFactory, exclude="other_field"):
-        other_field = "Bob"
 
-    assert _ExcludesDerivedFactory() == child_domain
+# `another_field` shouldn't get used when creating the model for this factory
+class ExcludesInMetaBaseFactory(Factory[ChildDomain]):
+    class Meta:
+        exclude = ("another_field",)
 
+    first_name = "Billy"
+    second_name = "Jim"
+    another_field = "Bob"
 
-def test_factory_excludes_in_meta_inner_class(child_domain: common.ChildDomain) -> None:
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(Factory[common.ChildDomain]):
-        class Meta:
-            exclude = ("other_field",)
 
-        first_name = "Billy"
-        second_name = "Jim"
-        other_field = "Bob"
+# `other_field` shouldn't get used when creating the model for this factory
+class ExcludesInMetaDerivedFactory(ExcludesInMetaBaseFactory):
+    class Meta:
+        exclude = ("other_field",)
 
-    assert _ExcludesFactory() == child_domain
+    other_field = "Bob"
 
 
-def test_factory_excludes_in_meta_inner_class_merges_with_superclass(
-    child_domain: common.ChildDomain,
+@inject_factory_method(ParentFactory)
+def test_factory(
+    factory_method: Callable[..., common.ParentDomain],
+    parent_domain: common.ParentDomain,
 ) -> None:
-    # `another_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(Factory[common.ChildDomain]):
-        class Meta:
-            exclude = ("another_field",)
+    model = factory_method()
+    assert model == parent_domain
 
-        first_name = "Billy"
-        second_name = "Jim"
-        another_field = "Bob"
 
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesDerivedFactory(_ExcludesFactory):
-        class Meta:
-            exclude = ("other_field",)
+@inject_factory_method(ParentFactory, batch=True)
+def test_factory_batch(
+    factory_method: Callable[..., list[common.ParentDomain]],
+    parent_domain: common.ParentDomain,
+) -> None:
+    models = factory_method(size=1)
+    assert models == [parent_domain]
 
-        other_field = "Bob"
 
-    assert _ExcludesDerivedFactory() == child_domain
+@pytest.mark.parametrize(
+    "factory_cls",
+    [
+        ExcludesFactory,
+        ExcludesDerivedFactory,
+        ExcludesInMetaFactory,
+        ExcludesInMetaDerivedFactory,
+    ],
+)
+def test_factory_excludes(
+    factory_cls: type[Factory[common.ChildDomain]],
+    child_domain: common.ChildDomain,
+) -> None:
+    assert factory_cls() == child_domain
 
 
 def test_raises_when_factory_data_does_match_model() -> None:
-    with pytest.raises(
-        errors.FactoryError,
-        match=r"Failed to define '_InvalidFactory' : Failed to create Model object : ChildDomain.__init__\(\) got an unexpected keyword argument 'other_name'",
-    ):
+    with pytest.raises(errors.FactoryError) as exc_info:
         # `other_name` is not valid property for the `ChildDomain` base model
         class _InvalidFactory(Factory[common.ChildDomain]):
             other_name = "Billy"
+
+    assert (
+        "Failed to define '_InvalidFactory' : Failed to create Model object : ChildDomain.__init__() got an unexpected keyword argument 'other_name'"
+        in str(exc_info.value)
+    )
+
+
+def test_factory_skips_validation_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("multi_factory.meta.VALIDATE_FACTORIES", False)
+
+    # `other_name` is not valid property for the `ChildDomain` base model,
+    # but the factory isn't built when it is defined so no error is raised here
+    class _InvalidFactory(Factory[common.ChildDomain]):
+        other_name = "Billy"
+
+    with pytest.raises(errors.ModelCreationError):
+        _InvalidFactory()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, True),
+        ("1", True),
+        ("true", True),
+        ("yes", True),
+        ("", True),
+        ("0", False),
+        ("false", False),
+        ("no", False),
+        ("off", False),
+        ("FALSE", False),
+        (" Off ", False),
+    ],
+)
+def test_validation_enabled_parses_environment_variable_value(
+    value: str | None, expected: bool
+) -> None:
+    assert _validation_enabled(value) is expected
@@ -1,6 +1,9 @@
+import datetime
+import gc
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any, Callable
+from uuid import UUID
 
 import pytest
 
@@ -9,6 +12,7 @@ from tests import common
 
 from marshmallow import Schema, fields, post_load
 from multi_factory import errors, JSONToDomainFactory, JSONToDomainFactoryResult
+from multi_factory import json_to_domain
 from tests.common import (
     ChildDomain,
     ParentDomain,
@@ -17,7 +21,7 @@ from tests.common import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def json_to_domain_factory_result(
     parent_dict: dict[str, Any], parent_domain: common.ParentDomain
 ) -> JSONToDomainFactoryResult[common.ParentDomain]:
@@ -68,6 +72,287 @@ class ParentJSONToDomainFactory(JSONToDomainFactory[ParentDomain, ParentSchema])
     children = lazy_attribute(lambda: [ChildJSONToDomainFactory.build().base])
 
 
+class ParentWithSingleChildJSONToDomainFactory(
+    JSONToDomainFactory[ParentWithSingleChildDomain, ParentWithSingleChildSchema]
+):
+    first_name = "Jim"
+    second_name = "Jim"
+    child = sub_factory(ChildJSONToDomainFactory)
+
+
+class ParentWithListOfChildrenJSONToDomainFactory(
+    JSONToDomainFactory[ParentDomain, ParentSchema]
+):
+    first_name = "Jim"
+    second_name = "Jim"
+    children = [ChildJSONToDomainFactory.build().base]
+
+
+class OtherChildJSONToDomainFactory(JSONToDomainFactory[ChildDomain, ChildSchema]):
+    first_name = "Bob"
+    second_name = "Jim"
+
+
+class DerivedChildJSONToDomainFactory(ChildJSONToDomainFactory):
+    first_name = "Bob"
+
+
+# A schema that only implements the bare `load(data)` method of the `Schema` protocol
+class LoadOnlyChildSchema:
+    def load(self, data: Any) -> ChildDomain:
+        return ChildDomain(**data)
+
+
+class LoadOnlyChildJSONToDomainFactory(
+    JSONToDomainFactory[ChildDomain, LoadOnlyChildSchema]
+):
+    first_name = "Billy"
+    second_name = "Jim"
+
+
+# `other_field` shouldn't get used when creating the model or domain object for this factory
+class ExcludesJSONToDomainFactory(
+    JSONToDomainFactory[ChildDomain, ChildSchema], exclude="other_field"
+):
+    first_name = "Billy"
+    second_name = "Jim"
+    other_field = "Bob"
+
+
+# `another_field` shouldn't get used when creating the model or domain object for this factory
+class ExcludesBaseJSONToDomainFactory(
+    JSONToDomainFactory[ChildDomain, ChildSchema], exclude="another_field"
+):
+    first_name = "Billy"
+    second_name = "Jim"
+    another_field = "Bob"
+
+
+# `other_field` shouldn't get used when creating the model or domain object for this factory
+class ExcludesDerivedJSONToDomainFactory(
+    ExcludesBaseJSONToDomainFactory, exclude="other_field"
+):
+    other_field = "Bob"
+
+
+# `other_field` shouldn't get used when creating the model or domain object for this factory
+class ExcludesInMetaJSONToDomainFactory(JSONToDomainFactory[ChildDomain, ChildSchema]):
+    class Meta:
+        exclude = ("other_field",)
+
+    first_name = "Billy"
+    second_name = "Jim"
+    other_field = "Bob"
+
+
+# `another_field` shouldn't get used when creating the model or domain object for this factory
+class ExcludesInMetaBaseJSONToDomainFactory(
+    JSONToDomainFactory[ChildDomain, ChildSchema]
+):
+    class Meta:
+        exclude = ("another_field",)
+
+    first_name = "Billy"
+    second_name = "Jim"
+    another_field = "Bob"
+
+
+# `other_field` shouldn't get used when creating the model or domain object for this factory
+class ExcludesInMetaDerivedJSONToDomainFactory(ExcludesInMetaBaseJSONToDomainFactory):
+    class Meta:
+        exclude = ("other_field",)
+
+    other_field = "Bob"
+
+
+class FirstEnum(Enum):
+    FIRST = auto()
+
+
+class SecondEnum(Enum):
+    SECOND = auto()
+
+
+def enum_name_upper(enum: Enum) -> str:
+    return enum.name.upper()
+
+
+def enum_name_lower(enum: Enum) -> str:
+    return enum.name.lower()
+
+
+@dataclass(slots=True, frozen=True)
+class FirstEnumDomain:
+    first: FirstEnum
+
+
+@dataclass(slots=True, frozen=True)
+class FirstAndSecondEnumDomain:
+    first: FirstEnum
+    second: SecondEnum
+
+
+class FirstEnumSchema(BaseSchema):
+    _domain_cls = FirstEnumDomain
+    first = fields.Enum(FirstEnum)
+
+
+class FirstAndSecondEnumSchema(BaseSchema):
+    _domain_cls = FirstAndSecondEnumDomain
+    first = fields.Enum(FirstEnum)
+    second = fields.Enum(SecondEnum)
+
+
+# We will use `FirstEnum.name.upper()` in the below factory when we convert
+# `first` into a JSON serialisable form
+class EnumConversionJSONToDomainFactory(
+    JSONToDomainFactory[FirstEnumDomain, FirstEnumSchema],
+    enum_conversion_map={FirstEnum: enum_name_upper},
+):
+    first = FirstEnum.FIRST
+
+
+# We will use `FirstEnum.name.upper()` in the below factory when we convert
+# `first` into a JSON serialisable form
+class EnumConversionBaseJSONToDomainFactory(
+    JSONToDomainFactory[FirstAndSecondEnumDomain, FirstAndSecondEnumSchema],
+    enum_conversion_map={FirstEnum: enum_name_upper},
+):
+    first = FirstEnum.FIRST
+    second = SecondEnum.SECOND
+
+
+class EnumConversionDerivedJSONToDomainFactory(
+    EnumConversionBaseJSONToDomainFactory,
+    enum_conversion_map={SecondEnum: enum_name_upper},
+):
+    second = SecondEnum.SECOND
+
+
+@dataclass(slots=True, frozen=True)
+class SecondEnumNameDomain:
+    second: str
+
+
+class SecondEnumNameSchema(BaseSchema):
+    _domain_cls = SecondEnumNameDomain
+    second = fields.String()
+
+
+# We will use `SecondEnum.name.upper()` in the below factory when we convert
+# `second` into a JSON serialisable form
+class EnumConversionToUpperJSONToDomainFactory(
+    JSONToDomainFactory[SecondEnumNameDomain, SecondEnumNameSchema],
+    enum_conversion_map={SecondEnum: enum_name_upper},
+):
+    second = SecondEnum.SECOND
+
+
+# We will use `SecondEnum.name.lower()` in the below factory when we convert `second` into a
+# JSON serialisable form, overriding the superclass's `enum_conversion_map` entry for `SecondEnum`
+class EnumConversionToLowerJSONToDomainFactory(
+    EnumConversionToUpperJSONToDomainFactory,
+    enum_conversion_map={SecondEnum: enum_name_lower},
+):
+    pass
+
+
+# We will use `FirstEnum.name` in the below factory when we convert
+# `first` into a JSON serialisable form by default as `enum_conversion_map` isn't provided
+class NoEnumConversionJSONToDomainFactory(
+    JSONToDomainFactory[FirstEnumDomain, FirstEnumSchema]
+):
+    first = FirstEnum.FIRST
+
+
+NESTED_ID = UUID("4b7c6a4e-8f5a-4a5e-9a4e-2e4a8c3b7d1f")
+NESTED_DATE = datetime.date(2024, 1, 1)
+
+
+@dataclass(slots=True, frozen=True)
+class NestedValuesDomain:
+    ids: list[UUID]
+    dates: list[datetime.date]
+
+
+class NestedValuesSchema(BaseSchema):
+    _domain_cls = NestedValuesDomain
+    ids = fields.List(fields.UUID())
+    dates = fields.List(fields.Date())
+
+
+# Nested `UUID` and `date` values (including those in tuples) should be converted into JSON
+class NestedValuesJSONToDomainFactory(
+    JSONToDomainFactory[NestedValuesDomain, NestedValuesSchema]
+):
+    ids = [NESTED_ID]
+    dates = (NESTED_DATE,)
+
+
+class ValueEnum(Enum):
+    ID = NESTED_ID
+    PAIR = (1, 2)
+
+
+def enum_value(enum: Enum) -> Any:
+    return enum.value
+
+
+@dataclass(slots=True, frozen=True)
+class EnumValuesDomain:
+    id: UUID
+    pair: list[int]
+
+
+class EnumValuesSchema(BaseSchema):
+    _domain_cls = EnumValuesDomain
+    id = fields.UUID()
+    pair = fields.List(fields.Integer())
+
+
+# The values returned by `enum_value` in the below factory (a `UUID` and a `tuple`) aren't
+# JSON serialisable themselves, so they must also be converted into a JSON serialisable form
+class EnumValuesJSONToDomainFactory(
+    JSONToDomainFactory[EnumValuesDomain, EnumValuesSchema],
+    enum_conversion_map={ValueEnum: enum_value},
+):
+    id = ValueEnum.ID
+    pair = ValueEnum.PAIR
+
+
+class SwapEnum(Enum):
+    X = auto()
+    Y = auto()
+
+
+def swap_x_for_y(enum: Enum) -> Any:
+    return SwapEnum.Y if enum is SwapEnum.X else enum.name.lower()
+
+
+# `SwapEnum.X` is converted into another member of the same enum (`SwapEnum.Y`) in the below
+# factory, which is then converted again into its lowercase name
+class SwapEnumJSONToDomainFactory(
+    JSONToDomainFactory[SecondEnumNameDomain, SecondEnumNameSchema],
+    enum_conversion_map={SwapEnum: swap_x_for_y},
+):
+    second = SwapEnum.X
+
+
+@dataclass(slots=True, frozen=True)
+class KeysDomain:
+    values: dict[str, str]
+
+
+class KeysSchema(BaseSchema):
+    _domain_cls = KeysDomain
+    values = fields.Dict(keys=fields.String(), values=fields.String())
+
+
+# Non `str` keys should be converted into JSON object keys the same way `json.dumps` converts them
+class KeysJSONToDomainFactory(JSONToDomainFactory[KeysDomain, KeysSchema]):
+    values = {2: "int", 1.5: "float", True: "bool", None: "none"}
+
+
 @inject_factory_method(ParentJSONToDomainFactory)
 def test_json_to_domain_factory(
     factory_method: Callable[..., JSONToDomainFactoryResult[common.ParentDomain]],
@@ -86,24 +371,25 @@ def test_json_to_domain_factory_batch(
     assert models == [json_to_domain_factory_result]
 
 
+@inject_factory_method(ChildJSONToDomainFactory, batch=True)
+def test_json_to_domain_factory_batch_with_overrides(
+    factory_method: Callable[..., list[JSONToDomainFactoryResult[common.ChildDomain]]],
+) -> None:
+    models = factory_method(size=2, first_name="Bob")
+    assert models == 2 * [
+        JSONToDomainFactoryResult(
+            base={"first_name": "Bob", "second_name": "Jim"},
+            json={"first_name": "Bob", "second_name": "Jim"},
+            domain=common.ChildDomain(first_name="Bob", second_name="Jim"),
+        )
+    ]
+
+
 def test_json_to_domain_with_sub_factory(
     parent_with_single_child_dict: dict[str, Any],
     parent_with_single_child_domain: common.ParentDomain,
 ) -> None:
-    class _SubFactory(JSONToDomainFactory[common.ChildDomain, ChildSchema]):
-        first_name = "Billy"
-        second_name = "Jim"
-
-    class _MainFactory(
-        JSONToDomainFactory[
-            common.ParentWithSingleChildDomain, ParentWithSingleChildSchema
-        ]
-    ):
-        first_name = "Jim"
-        second_name = "Jim"
-        child = sub_factory(_SubFactory)
-
-    assert _MainFactory() == JSONToDomainFactoryResult(
+    assert ParentWithSingleChildJSONToDomainFactory() == JSONToDomainFactoryResult(
         base=parent_with_single_child_dict,
         json=parent_with_single_child_dict,
         domain=parent_with_single_child_domain,
@@ -113,250 +399,220 @@ def test_json_to_domain_with_sub_factory(
 def test_json_to_domain_with_list_of_sub_factories(
     parent_dict: dict[str, Any], parent_domain: common.ParentDomain
 ) -> None:
-    class _SubFactory(JSONToDomainFactory[common.ChildDomain, ChildSchema]):
-        first_name = "Billy"
-        second_name = "Jim"
-
-    class _MainFactory(JSONToDomainFactory[common.ParentDomain, ParentSchema]):
-        first_name = "Jim"
-        second_name = "Jim"
-        children = [_SubFactory.build().base]
-
-    assert _MainFactory() == JSONToDomainFactoryResult(
+    assert ParentWithListOfChildrenJSONToDomainFactory() == JSONToDomainFactoryResult(
         base=parent_dict, json=parent_dict, domain=parent_domain
     )
 
 
-def test_json_to_domain_factory_excludes(
-    child_dict: dict[str, Any], child_domain: common.ChildDomain
-) -> None:
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(
-        JSONToDomainFactory[common.ChildDomain, ChildSchema],
-        exclude="other_field",
-    ):
-        first_name = "Billy"
-        second_name = "Jim"
-        other_field = "Bob"
-
-    assert _ExcludesFactory() == JSONToDomainFactoryResult(
-        base=child_dict, json=child_dict, domain=child_domain
+# `_schema` is looked up using `getattr` in the below tests as it is declared as a generic instance variable
+def test_json_to_domain_factories_share_schema_instance() -> None:
+    assert getattr(OtherChildJSONToDomainFactory, "_schema") is getattr(
+        ChildJSONToDomainFactory, "_schema"
     )
 
 
-def test_json_to_domain_factory_excludes_merges_with_superclass(
-    child_dict: dict[str, Any], child_domain: common.ChildDomain
-) -> None:
-    # `another_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(
-        JSONToDomainFactory[common.ChildDomain, ChildSchema],
-        exclude="another_field",
-    ):
-        first_name = "Billy"
-        second_name = "Jim"
-        another_field = "Bob"
+def test_json_to_domain_derived_factory_shares_schema_instance() -> None:
+    assert getattr(DerivedChildJSONToDomainFactory, "_schema") is getattr(
+        ChildJSONToDomainFactory, "_schema"
+    )
 
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesDerivedFactory(_ExcludesFactory, exclude="other_field"):
-        other_field = "Bob"
 
-    assert _ExcludesDerivedFactory() == JSONToDomainFactoryResult(
-        base=child_dict, json=child_dict, domain=child_domain
-    )
+def test_json_to_domain_factory_schema_cache_drops_schemas_of_failed_factories() -> (
+    None
+):
+    class _TempSchema(ChildSchema):
+        pass
 
+    with pytest.raises(errors.FactoryError):
+        # `first_name` is not defined on the factory, so schema validation will fail
+        class _InvalidFactory(JSONToDomainFactory[common.ChildDomain, _TempSchema]):
+            second_name = "Jim"
 
-def test_json_to_domain_factory_excludes_in_meta_inner_class(
-    child_dict: dict[str, Any], child_domain: common.ChildDomain
-) -> None:
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(JSONToDomainFactory[common.ChildDomain, ChildSchema]):
-        class Meta:
-            exclude = ("other_field",)
+    # The failed factory class is the only thing that used the `_TempSchema` instance,
+    # so the instance (and its cache entry) is gone once the factory class is collected
+    gc.collect()
+    assert _TempSchema not in json_to_domain._SCHEMA_CACHE
 
-        first_name = "Billy"
-        second_name = "Jim"
-        other_field = "Bob"
 
-    assert _ExcludesFactory() == JSONToDomainFactoryResult(
+@pytest.mark.parametrize(
+    "factory_cls",
+    [
+        ExcludesJSONToDomainFactory,
+        ExcludesDerivedJSONToDomainFactory,
+        ExcludesInMetaJSONToDomainFactory,
+        ExcludesInMetaDerivedJSONToDomainFactory,
+    ],
+)
+def test_json_to_domain_factory_excludes(
+    factory_cls: type[JSONToDomainFactory[common.ChildDomain, ChildSchema]],
+    child_dict: dict[str, Any],
+    child_domain: common.ChildDomain,
+) -> None:
+    assert factory_cls() == JSONToDomainFactoryResult(
         base=child_dict, json=child_dict, domain=child_domain
     )
 
 
-def test_json_to_domain_factory_excludes_in_meta_inner_class_merges_with_superclass(
-    child_dict: dict[str, Any], child_domain: common.ChildDomain
-) -> None:
-    # `another_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesFactory(JSONToDomainFactory[common.ChildDomain, ChildSchema]):
-        class Meta:
-            exclude = ("another_field",)
+def test_json_to_domain_factory_enum_conversion_map() -> None:
+    assert EnumConversionJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"first": FirstEnum.FIRST},
+        json={"first": "FIRST"},
+        domain=FirstEnumDomain(first=FirstEnum.FIRST),
+    )
 
-        first_name = "Billy"
-        second_name = "Jim"
-        another_field = "Bob"
 
-    # `other_field` shouldn't get used when creating the model or domain object for this factory
-    class _ExcludesDerivedFactory(_ExcludesFactory):
-        class Meta:
-            exclude = ("other_field",)
+def test_json_to_domain_factory_enum_conversion_map_merges_with_superclass() -> None:
+    assert EnumConversionDerivedJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"first": FirstEnum.FIRST, "second": SecondEnum.SECOND},
+        json={"first": "FIRST", "second": "SECOND"},
+        domain=FirstAndSecondEnumDomain(
+            first=FirstEnum.FIRST, second=SecondEnum.SECOND
+        ),
+    )
 
-        other_field = "Bob"
 
-    assert _ExcludesDerivedFactory() == JSONToDomainFactoryResult(
-        base=child_dict, json=child_dict, domain=child_domain
+def test_json_to_domain_factory_enum_conversion_map_overrides_superclass() -> None:
+    assert EnumConversionToLowerJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"second": SecondEnum.SECOND},
+        json={"second": "second"},
+        domain=SecondEnumNameDomain(second="second"),
     )
 
+    # The superclass's `enum_conversion_map` shouldn't be modified by the subclass
+    assert EnumConversionToUpperJSONToDomainFactory().json == {"second": "SECOND"}
 
-def test_json_to_domain_factory_enum_conversion_map() -> None:
-    class _TempEnum(Enum):
-        FIRST = auto()
-
-    @dataclass
-    class _TempDomain:
-        first: _TempEnum
 
-    class _TempSchema(BaseSchema):
-        _domain_cls = _TempDomain
-        first = fields.Enum(_TempEnum)
-
-    # We will use `_TempEnum.name.upper()` in the below factory when we convert
-    # `first` into a JSON serialisable form
-    class _EnumConversionFactory(
-        JSONToDomainFactory[_TempDomain, _TempSchema],
-        enum_conversion_map={_TempEnum: lambda enum: enum.name.upper()},
-    ):
-        first = _TempEnum.FIRST
-
-    assert _EnumConversionFactory() == JSONToDomainFactoryResult(
-        base={"first": _TempEnum.FIRST},
+def test_json_to_domain_factory_with_no_enum_conversion_map_defaults_to_name() -> None:
+    assert NoEnumConversionJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"first": FirstEnum.FIRST},
         json={"first": "FIRST"},
-        domain=_TempDomain(first=_TempEnum.FIRST),
+        domain=FirstEnumDomain(first=FirstEnum.FIRST),
     )
 
 
-def test_json_to_domain_factory_enum_conversion_map_merges_with_superclass() -> None:
-    class _TempEnum(Enum):
-        FIRST = auto()
-
-    class _TempEnum2(Enum):
-        SECOND = auto()
+def test_json_to_domain_factory_with_schema_that_only_implements_load(
+    child_dict: dict[str, Any], child_domain: common.ChildDomain
+) -> None:
+    assert LoadOnlyChildJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base=child_dict, json=child_dict, domain=child_domain
+    )
 
-    @dataclass
-    class _TempDomain:
-        first: _TempEnum
-        second: _TempEnum2
 
-    class _TempSchema(BaseSchema):
-        _domain_cls = _TempDomain
-        first = fields.Enum(_TempEnum)
-        second = fields.Enum(_TempEnum2)
-
-    # We will use `_TempEnum.name.upper()` in the below factory when we convert
-    # `first` into a JSON serialisable form
-    class _EnumConversionFactory(
-        JSONToDomainFactory[_TempDomain, _TempSchema],
-        enum_conversion_map={_TempEnum: lambda enum: enum.name.upper()},
-    ):
-        first = _TempEnum.FIRST
-        second = _TempEnum2.SECOND
-
-    class _EnumConverionDerivedFactory(
-        _EnumConversionFactory,
-        enum_conversion_map={_TempEnum2: lambda enum: enum.name.upper()},
-    ):
-        second = _TempEnum2.SECOND
-
-    assert _EnumConverionDerivedFactory() == JSONToDomainFactoryResult(
-        base={"first": _TempEnum.FIRST, "second": _TempEnum2.SECOND},
-        json={"first": "FIRST", "second": "SECOND"},
-        domain=_TempDomain(first=_TempEnum.FIRST, second=_TempEnum2.SECOND),
+def test_json_to_domain_factory_converts_nested_values_into_json() -> None:
+    assert NestedValuesJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"ids": [NESTED_ID], "dates": (NESTED_DATE,)},
+        json={"ids": [str(NESTED_ID)], "dates": ["2024-01-01"]},
+        domain=NestedValuesDomain(ids=[NESTED_ID], dates=[NESTED_DATE]),
     )
 
 
-def test_json_to_domain_factory_with_no_enum_conversion_map_defaults_to_name() -> None:
-    class _TempEnum(Enum):
-        FIRST = auto()
+def test_json_to_domain_factory_converts_enum_conversion_results_into_json() -> None:
+    assert EnumValuesJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"id": ValueEnum.ID, "pair": ValueEnum.PAIR},
+        json={"id": str(NESTED_ID), "pair": [1, 2]},
+        domain=EnumValuesDomain(id=NESTED_ID, pair=[1, 2]),
+    )
 
-    @dataclass
-    class _TempDomain:
-        first: _TempEnum
 
-    class _TempSchema(BaseSchema):
-        _domain_cls = _TempDomain
-        first = fields.Enum(_TempEnum)
+def test_json_to_domain_factory_converts_enum_conversion_result_of_the_same_enum() -> (
+    None
+):
+    assert SwapEnumJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"second": SwapEnum.X},
+        json={"second": "y"},
+        domain=SecondEnumNameDomain(second="y"),
+    )
 
-    # We will use `_TempEnum.name` in the below factory when we convert
-    # `first` into a JSON serialisable form by default as `enum_conversion_map` isn't provided
-    class _NoEnumConverionFactory(JSONToDomainFactory[_TempDomain, _TempSchema]):
-        first = _TempEnum.FIRST
 
-    assert _NoEnumConverionFactory() == JSONToDomainFactoryResult(
-        base={"first": _TempEnum.FIRST},
-        json={"first": "FIRST"},
-        domain=_TempDomain(first=_TempEnum.FIRST),
+def test_json_to_domain_factory_converts_non_str_keys_into_json() -> None:
+    values = {"2": "int", "1.5": "float", "true": "bool", "null": "none"}
+    assert KeysJSONToDomainFactory() == JSONToDomainFactoryResult(
+        base={"values": {2: "int", 1.5: "float", True: "bool", None: "none"}},
+        json={"values": values},
+        domain=KeysDomain(values=values),
     )
 
 
 def test_raises_when_json_to_domain_factory_with_list_of_sub_factories_without_base() -> (
     None
 ):
-    class _SubFactory(JSONToDomainFactory[common.ChildDomain, ChildSchema]):
-        first_name = "Billy"
-        second_name = "Jim"
-
-    with pytest.raises(
-        errors.FactoryError,
-        match=r"Failed to define '_InvalidFactory' : Schema failed to serialise to JSON : Must use 'base' property when instantiating a list of sub factories inside a factory declaration e.g sub_factories = \[SubFactory\(\).base\]",
-    ):
+    with pytest.raises(errors.FactoryError) as exc_info:
 
         class _InvalidFactory(JSONToDomainFactory[common.ParentDomain, ParentSchema]):
             first_name = "Jim"
             second_name = "Jim"
-            children = [_SubFactory()]
+            children = [ChildJSONToDomainFactory()]
+
+    assert (
+        "Failed to define '_InvalidFactory' : Schema failed to serialise to JSON : Must use 'base' property when instantiating a list of sub factories inside a factory declaration e.g sub_factories = [SubFactory().base]"
+        in str(exc_info.value)
+    )
 
 
 def test_raises_when_json_to_domain_factory_domain_type_does_not_match_schema_domain_type() -> (
     None
 ):
-    with pytest.raises(
-        errors.FactoryError,
-        match=r"Failed to define '_InvalidFactory' : Failed to create Domain object : ParentDomain.__init__\(\) missing 1 required positional argument: 'children'",
-    ):
+    with pytest.raises(errors.FactoryError) as exc_info:
         # `ChildDomain` is not the same as the domain result that `ParentSchema` returns
         class _InvalidFactory(JSONToDomainFactory[common.ChildDomain, ParentSchema]):
             first_name = "Billy"
             second_name = "Jim"
 
+    assert (
+        "Failed to define '_InvalidFactory' : Failed to create Domain object : ParentDomain.__init__() missing 1 required positional argument: 'children'"
+        in str(exc_info.value)
+    )
+
 
 def test_raises_when_json_to_domain_factory_domain_type_does_not_match_schema_domain_result_type() -> (
     None
 ):
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class ChildDomain2:
         first_name: str
         second_name: str
 
-    with pytest.raises(
-        errors.FactoryError,
-        match="Failed to define '_InvalidFactory' : Schema domain type 'ChildDomain' doesn't match provided domain type 'ChildDomain2'",
-    ):
+    with pytest.raises(errors.FactoryError) as exc_info:
         # `ChildSchema` does not return the same domain result type as `ChildDomain2`
         class _InvalidFactory(JSONToDomainFactory[ChildDomain2, ChildSchema]):
             first_name = "Billy"
             second_name = "Jim"
 
+    assert (
+        "Failed to define '_InvalidFactory' : Schema domain type 'ChildDomain' doesn't match provided domain type 'ChildDomain2'"
+        in str(exc_info.value)
+    )
+
 
 def test_raises_when_json_to_domain_factory_data_fails_schema_validation() -> None:
-    with pytest.raises(
-        errors.FactoryError,
-        match=r"Failed to define '_InvalidFactory' : Schema failed to validate data : {'first_name': \['Missing data for required field.'\]}",
-    ):
+    with pytest.raises(errors.FactoryError) as exc_info:
         # `first_name` is not defined on the factory, so schema validation will fail
         class _InvalidFactory(JSONToDomainFactory[common.ChildDomain, ChildSchema]):
             second_name = "Jim"
 
+    assert (
+        "Failed to define '_InvalidFactory' : Schema failed to validate data : {'first_name': ['Missing data for required field.']}"
+        in str(exc_info.value)
+    )
+
+
+@inject_factory_method(ChildJSONToDomainFactory, batch=True)
+def test_raises_when_json_to_domain_factory_batch_data_fails_schema_validation(
+    factory_method: Callable[..., list[JSONToDomainFactoryResult[common.ChildDomain]]],
+) -> None:
+    # `first_name` is not a string, so schema validation will fail for every item in the batch
+    with pytest.raises(errors.SchemaValidationError) as exc_info:
+        factory_method(size=2, first_name=1)
+
+    # Errors are reported per item index as the whole batch is validated in a single schema load
+    assert (
+        str(exc_info.value)
+        == "{0: {'first_name': ['Not a valid string.']}, 1: {'first_name': ['Not a valid string.']}}"
+    )
+
 
 def test_raises_when_json_to_domain_factory_data_does_not_match_domain() -> None:
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class _TempDomain:
         first_name: str
 
@@ -365,11 +621,45 @@ def test_raises_when_json_to_domain_factory_data_does_not_match_domain() -> None
         first_name = fields.String()
         second_name = fields.String()
 
-    with pytest.raises(
-        errors.FactoryError,
-        match=r"Failed to define '_InvalidFactory' : Failed to create Domain object : .* got an unexpected keyword argument 'second_name'",
-    ):
+    with pytest.raises(errors.FactoryError) as exc_info:
         # `second_name` is not defined on `_TempDomain`, so domain object creation will fail
         class _InvalidFactory(JSONToDomainFactory[_TempDomain, _TempSchema]):
             first_name = "Billy"
             second_name = "Jim"
+
+    assert (
+        "Failed to define '_InvalidFactory' : Failed to create Domain object : "
+        in str(exc_info.value)
+    )
+    assert " got an unexpected keyword argument 'second_name'" in str(exc_info.value)
+
+
+def test_raises_when_json_to_domain_factory_enum_conversion_returns_a_circular_reference() -> (
+    None
+):
+    with pytest.raises(errors.FactoryError) as exc_info:
+        # `FirstEnum` is converted into itself, so it can never be converted into a JSON serialisable form
+        class _InvalidFactory(
+            JSONToDomainFactory[FirstEnumDomain, FirstEnumSchema],
+            enum_conversion_map={FirstEnum: lambda enum: enum},
+        ):
+            first = FirstEnum.FIRST
+
+    assert (
+        "Failed to define '_InvalidFactory' : Schema failed to serialise to JSON : Circular reference detected when JSON encoding value : FirstEnum.FIRST"
+        in str(exc_info.value)
+    )
+
+
+def test_json_to_domain_factory_skips_validation_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("multi_factory.meta.VALIDATE_FACTORIES", False)
+
+    # `first_name` is not defined on the factory, but the factory isn't built
+    # when it is defined so no error is raised here
+    class _InvalidFactory(JSONToDomainFactory[common.ChildDomain, ChildSchema]):
+        second_name = "Jim"
+
+    with pytest.raises(errors.SchemaValidationError):
+        _InvalidFactory()
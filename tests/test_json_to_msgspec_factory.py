@@ -0,0 +1,121 @@
+from enum import Enum, auto
+from typing import Any, Callable
+
+import msgspec
+import pytest
+
+from multi_factory import errors, JSONToDomainFactoryResult
+from multi_factory.json_to_msgspec import JSONToMsgspecFactory
+from multi_factory.utils import lazy_attribute
+from tests import common
+from tests.common import ChildDomain, ParentDomain, inject_factory_method
+
+
+@pytest.fixture(scope="session")
+def json_to_msgspec_factory_result(
+    parent_dict: dict[str, Any], parent_domain: common.ParentDomain
+) -> JSONToDomainFactoryResult[common.ParentDomain]:
+    return JSONToDomainFactoryResult(
+        base=parent_dict, json=parent_dict, domain=parent_domain
+    )
+
+
+class ChildJSONToMsgspecFactory(JSONToMsgspecFactory[ChildDomain]):
+    first_name = "Billy"
+    second_name = "Jim"
+
+
+class ParentJSONToMsgspecFactory(JSONToMsgspecFactory[ParentDomain]):
+    first_name = "Jim"
+    second_name = "Jim"
+    children = lazy_attribute(lambda: [ChildJSONToMsgspecFactory.build().base])
+
+
+class FirstEnum(Enum):
+    FIRST = auto()
+
+
+class FirstEnumStruct(msgspec.Struct):
+    first: FirstEnum
+
+
+# `msgspec` decodes enums from their values, so `first` is converted into `FirstEnum.value`
+# by default in the below factory when we convert it into a JSON serialisable form
+class EnumJSONToMsgspecFactory(JSONToMsgspecFactory[FirstEnumStruct]):
+    first = FirstEnum.FIRST
+
+
+class FirstEnumNameStruct(msgspec.Struct):
+    first: str
+
+
+def enum_name(enum: Enum) -> str:
+    return enum.name
+
+
+# We will use `FirstEnum.name` in the below factory when we convert
+# `first` into a JSON serialisable form, overriding the default of using `FirstEnum.value`
+class EnumConversionJSONToMsgspecFactory(
+    JSONToMsgspecFactory[FirstEnumNameStruct],
+    enum_conversion_map={FirstEnum: enum_name},
+):
+    first = FirstEnum.FIRST
+
+
+@inject_factory_method(ParentJSONToMsgspecFactory)
+def test_json_to_msgspec_factory(
+    factory_method: Callable[..., JSONToDomainFactoryResult[common.ParentDomain]],
+    json_to_msgspec_factory_result: JSONToDomainFactoryResult[common.ParentDomain],
+) -> None:
+    model = factory_method()
+    assert model == json_to_msgspec_factory_result
+
+
+@inject_factory_method(ParentJSONToMsgspecFactory, batch=True)
+def test_json_to_msgspec_factory_batch(
+    factory_method: Callable[..., list[JSONToDomainFactoryResult[common.ParentDomain]]],
+    json_to_msgspec_factory_result: JSONToDomainFactoryResult[common.ParentDomain],
+) -> None:
+    models = factory_method(size=1)
+    assert models == [json_to_msgspec_factory_result]
+
+
+def test_json_to_msgspec_factory_converts_enums_into_their_values_by_default() -> None:
+    assert EnumJSONToMsgspecFactory() == JSONToDomainFactoryResult(
+        base={"first": FirstEnum.FIRST},
+        json={"first": 1},
+        domain=FirstEnumStruct(first=FirstEnum.FIRST),
+    )
+
+
+def test_json_to_msgspec_factory_enum_conversion_map_overrides_default() -> None:
+    assert EnumConversionJSONToMsgspecFactory() == JSONToDomainFactoryResult(
+        base={"first": FirstEnum.FIRST},
+        json={"first": "FIRST"},
+        domain=FirstEnumNameStruct(first="FIRST"),
+    )
+
+
+def test_raises_when_json_to_msgspec_factory_data_fails_validation() -> None:
+    with pytest.raises(errors.FactoryError) as exc_info:
+        # `first_name` is not a string, so validation will fail
+        class _InvalidFactory(JSONToMsgspecFactory[common.ChildDomain]):
+            first_name = 1
+            second_name = "Jim"
+
+    assert (
+        "Failed to define '_InvalidFactory' : Schema failed to validate data : Expected `str`, got `int` - at `$.first_name`"
+        in str(exc_info.value)
+    )
+
+
+def test_raises_when_json_to_msgspec_factory_without_domain_type() -> None:
+    with pytest.raises(errors.FactoryError) as exc_info:
+
+        class _InvalidFactory(JSONToMsgspecFactory):  # type: ignore[type-arg]
+            first_name = "Billy"
+
+    assert (
+        "Failed to define '_InvalidFactory' : Must provide generic domain type"
+        in str(exc_info.value)
+    )